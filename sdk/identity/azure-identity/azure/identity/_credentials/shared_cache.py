@@ -2,7 +2,10 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
-from typing import TYPE_CHECKING, Any, Optional
+from concurrent.futures import Future
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from azure.core.credentials import AccessToken
 
 from .silent import SilentAuthenticationCredential
@@ -15,6 +18,11 @@ from .._internal.shared_token_cache import NO_TOKEN, SharedTokenCacheBase
 if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential
 
+_LOGGER = logging.getLogger(__name__)
+
+# whether this process has already suggested sharing a transport
+_transport_hint_logged = False
+
 
 class SharedTokenCacheCredential:
     """Authenticates using tokens in the local cache shared between Microsoft applications.
@@ -35,8 +43,9 @@ class SharedTokenCacheCredential:
     """
 
     def __init__(self, username: Optional[str] = None, **kwargs: Any) -> None:
-        if "authentication_record" in kwargs:
-            self._credential = SilentAuthenticationCredential(**kwargs)  # type: TokenCredential
+        authentication_record = kwargs.pop("authentication_record", None)
+        if authentication_record is not None:
+            self._credential = SilentAuthenticationCredential(authentication_record, **kwargs)  # type: TokenCredential
         else:
             self._credential = _SharedTokenCacheCredential(username=username, **kwargs)
 
@@ -97,6 +106,11 @@ class SharedTokenCacheCredential:
 class _SharedTokenCacheCredential(SharedTokenCacheBase):
     """The original SharedTokenCacheCredential, which doesn't use msal.ClientApplication"""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._inflight: Dict[Tuple[Tuple[str, ...], Optional[str], Optional[str], bool], Future] = {}
+        self._inflight_lock = threading.Lock()
+
     def __enter__(self):
         if self._client:
             self._client.__enter__()
@@ -117,10 +131,73 @@ class _SharedTokenCacheCredential(SharedTokenCacheBase):
         if not scopes:
             raise ValueError("'get_token' requires at least one scope")
 
+        token = self._try_cached(scopes, is_cae=enable_cae)
+        if token:
+            return token
+
+        if kwargs:
+            # arbitrary keyword arguments can't safely be part of the coalescing key
+            return self._refresh(scopes, claims=claims, tenant_id=tenant_id, is_cae=enable_cae, **kwargs)
+        return self._coalesced_refresh(scopes, claims=claims, tenant_id=tenant_id, is_cae=enable_cae)
+
+    def _coalesced_refresh(
+        self,
+        scopes: Tuple[str, ...],
+        *,
+        claims: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        is_cae: bool = False
+    ) -> AccessToken:
+        """Refresh a token, sharing the result with concurrent callers requesting the same token.
+
+        :param scopes: desired scopes for the access token
+        :type scopes: tuple[str, ...]
+        :keyword str claims: additional claims required in the token
+        :keyword str tenant_id: optional tenant to include in the token request
+        :keyword bool is_cae: whether to request a CAE token
+        :return: An access token with the desired scopes.
+        :rtype: ~azure.core.credentials.AccessToken
+        """
+
+        key = (scopes, claims, tenant_id, is_cae)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            token = self._refresh(scopes, claims=claims, tenant_id=tenant_id, is_cae=is_cae)
+        except Exception as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(token)
+            return token
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            if not future.done():
+                # e.g. KeyboardInterrupt; don't raise that in other threads, but don't leave them waiting either
+                future.cancel()
+
+    def _refresh(
+        self,
+        scopes: Tuple[str, ...],
+        *,
+        claims: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        is_cae: bool = False,
+        **kwargs: Any
+    ) -> AccessToken:
         if not self._client_initialized:
             self._initialize_client()
 
-        is_cae = enable_cae
         token_cache = self._cae_cache if is_cae else self._cache
 
         # Try to load the cache if it is None.
@@ -131,20 +208,30 @@ class _SharedTokenCacheCredential(SharedTokenCacheBase):
             if not token_cache:
                 raise CredentialUnavailableError(message="Shared token cache unavailable")
 
-        account = self._get_account(self._username, self._tenant_id, is_cae=is_cae)
+            # the cache was just loaded, so it hasn't been searched for an access token yet
+            token = self._try_cached(scopes, is_cae=is_cae)
+            if token:
+                return token
 
-        token = self._get_cached_access_token(scopes, account, is_cae=is_cae)
-        if token:
-            return token
+        # the cache may have changed since the account was last resolved
+        account = self._refresh_account(is_cae=is_cae)
 
-        # try each refresh token, returning the first access token acquired
-        for refresh_token in self._get_refresh_tokens(account, is_cae=is_cae):
-            token = self._client.obtain_token_by_refresh_token(
+        refresh_token = self._get_refresh_token(account, is_cae=is_cae)
+        if refresh_token is not None:
+            return self._client.obtain_token_by_refresh_token(
                 scopes, refresh_token, claims=claims, tenant_id=tenant_id, **kwargs
             )
-            return token
 
         raise CredentialUnavailableError(message=NO_TOKEN.format(account.get("username")))
 
     def _get_auth_client(self, **kwargs: Any) -> AadClientBase:
+        global _transport_hint_logged  # pylint:disable=global-statement
+        if kwargs.get("transport") is None and not _transport_hint_logged:
+            _transport_hint_logged = True
+            _LOGGER.info(
+                "SharedTokenCacheCredential is creating its own HTTP transport. To share a connection pool between "
+                "credentials, create one requests.Session and pass each credential its own "
+                "RequestsTransport(session=session, session_owner=False) with the 'transport' keyword argument. "
+                "Close the session yourself when the credentials are no longer needed."
+            )
         return AadClient(client_id=DEVELOPER_SIGN_ON_CLIENT_ID, **kwargs)
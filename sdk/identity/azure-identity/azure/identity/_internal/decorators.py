@@ -29,11 +29,14 @@ def log_get_token(class_name):
 
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
+            in_chain = within_credential_chain.get()
+            if not _LOGGER.isEnabledFor(logging.DEBUG if in_chain else logging.WARNING):
+                # neither outcome would be logged
+                return fn(*args, **kwargs)
+
             try:
                 token = fn(*args, **kwargs)
-                _LOGGER.log(
-                    logging.DEBUG if within_credential_chain.get() else logging.INFO, "%s succeeded", qualified_name
-                )
+                _LOGGER.log(logging.DEBUG if in_chain else logging.INFO, "%s succeeded", qualified_name)
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     try:
                         base64_meta_data = token.token.split(".")[1].encode("utf-8") + b"=="
@@ -51,7 +54,7 @@ def log_get_token(class_name):
                 return token
             except Exception as ex:  # pylint: disable=broad-except
                 _LOGGER.log(
-                    logging.DEBUG if within_credential_chain.get() else logging.WARNING,
+                    logging.DEBUG if in_chain else logging.WARNING,
                     "%s failed: %s",
                     qualified_name,
                     ex,
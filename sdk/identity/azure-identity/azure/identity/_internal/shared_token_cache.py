@@ -3,9 +3,11 @@
 # Licensed under the MIT License.
 # ------------------------------------
 import abc
+import functools
 import platform
+import threading
 import time
-from typing import Any, Iterable, List, Mapping, Optional, cast
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, cast
 from urllib.parse import urlparse
 import msal
 
@@ -33,6 +35,9 @@ matching the specified{}{} was found in the cache."""
 NO_TOKEN = """Token acquisition failed for user '{}'. To fix, re-authenticate
 through developer tooling supporting Azure single sign on"""
 
+# seconds to wait after failing to load a persistent cache before trying to load it again
+CACHE_LOAD_RETRY_INTERVAL = 5.0
+
 # build a dictionary {authority: {its known aliases}}, aliases taken from MSAL.NET's KnownMetadataProvider
 KNOWN_ALIASES = {
     alias: aliases  # N.B. aliases includes alias itself
@@ -101,15 +106,23 @@ class SharedTokenCacheBase(ABC):  # pylint: disable=too-many-instance-attributes
         self._client_kwargs["tenant_id"] = "organizations"
         self._client = cast(AadClientBase, None)
         self._client_initialized = False
+        self._init_lock = threading.Lock()
+        self._account_cache: Dict[Tuple[Optional[str], Optional[str], bool], CacheItem] = {}
+        self._account_cache_lock = threading.Lock()
+        self._cache_load_failures: Dict[bool, float] = {}
 
     def _initialize_client(self) -> None:
         if self._client_initialized:
             return
 
-        self._client = self._get_auth_client(
-            authority=self._authority, cache=self._cache, cae_cache=self._cae_cache, **self._client_kwargs
-        )
-        self._client_initialized = True
+        with self._init_lock:
+            # another thread may have initialized the client while this one waited for the lock
+            if self._client_initialized:
+                return
+            self._client = self._get_auth_client(
+                authority=self._authority, cache=self._cache, cae_cache=self._cae_cache, **self._client_kwargs
+            )
+            self._client_initialized = True
 
     def _initialize_cache(self, is_cae: bool = False) -> Optional[msal.TokenCache]:
 
@@ -121,11 +134,21 @@ class SharedTokenCacheBase(ABC):  # pylint: disable=too-many-instance-attributes
         if not self.supported():
             raise CredentialUnavailableError(message="Shared token cache is not supported on this platform.")
 
+        # don't retry a failed load right away; the cache is unlikely to have appeared since
+        last_failure = self._cache_load_failures.get(is_cae)
+        if last_failure is not None and time.monotonic() - last_failure < CACHE_LOAD_RETRY_INTERVAL:
+            return None
+
+        # accounts resolved from a previous cache instance may no longer be valid
+        with self._account_cache_lock:
+            self._account_cache.clear()
+
         if not self._cache and not is_cae:
             try:
                 self._cache = _load_persistent_cache(cache_options, is_cae)
                 self._client._cache = self._cache  # pylint:disable=protected-access
             except Exception:  # pylint:disable=broad-except
+                self._cache_load_failures[is_cae] = time.monotonic()
                 return None
 
         if not self._cae_cache and is_cae:
@@ -133,8 +156,10 @@ class SharedTokenCacheBase(ABC):  # pylint: disable=too-many-instance-attributes
                 self._cae_cache = _load_persistent_cache(cache_options, is_cae)
                 self._client._cae_cache = self._cae_cache  # pylint:disable=protected-access
             except Exception:  # pylint:disable=broad-except
+                self._cache_load_failures[is_cae] = time.monotonic()
                 return None
 
+        self._cache_load_failures.pop(is_cae, None)
         return self._cae_cache if is_cae else self._cache
 
     @abc.abstractmethod
@@ -222,8 +247,63 @@ class SharedTokenCacheBase(ABC):  # pylint: disable=too-many-instance-attributes
 
         raise CredentialUnavailableError(message=message)
 
+    def _refresh_account(self, is_cae: bool = False) -> CacheItem:
+        """Resolves this credential's account from the cache, replacing any account remembered earlier.
+
+        :param bool is_cae: whether to use the CAE cache
+        :return: an account
+        :rtype: CacheItem
+        """
+
+        key = (self._username, self._tenant_id, is_cae)
+        try:
+            account = self._get_account(self._username, self._tenant_id, is_cae=is_cae)
+        except Exception:
+            with self._account_cache_lock:
+                self._account_cache.pop(key, None)
+            raise
+        with self._account_cache_lock:
+            self._account_cache[key] = account
+        return account
+
+    def _get_cached_account(self, is_cae: bool = False) -> CacheItem:
+        """Returns this credential's account, resolving it from the cache only on first use.
+
+        The cache's accounts can change at any time, so only use this when a stale account is harmless.
+
+        :param bool is_cae: whether to use the CAE cache
+        :return: an account
+        :rtype: CacheItem
+        """
+
+        with self._account_cache_lock:
+            account = self._account_cache.get((self._username, self._tenant_id, is_cae))
+        if account is None:
+            account = self._refresh_account(is_cae=is_cae)
+        return account
+
+    def _try_cached(self, scopes: Tuple[str, ...], is_cae: bool = False) -> Optional[AccessToken]:
+        """Returns a cached access token without initializing the auth client or loading the cache.
+
+        :param scopes: desired scopes for the access token
+        :type scopes: tuple[str, ...]
+        :param bool is_cae: whether to look in the CAE cache
+        :return: a valid cached access token, or None when the cache isn't loaded or doesn't provide one
+        :raises ~azure.identity.CredentialUnavailableError: the cache's access tokens couldn't be read
+        :rtype: ~azure.core.credentials.AccessToken or None
+        """
+
+        if not (self._cae_cache if is_cae else self._cache):
+            return None
+        try:
+            account = self._get_cached_account(is_cae=is_cae)
+        except CredentialUnavailableError:
+            # leave raising account errors to the full path, which also initializes the client
+            return None
+        return self._get_cached_access_token(scopes, account, is_cae=is_cae)
+
     def _get_cached_access_token(
-        self, scopes: Iterable[str], account: CacheItem, is_cae: bool = False
+        self, scopes: Tuple[str, ...], account: CacheItem, is_cae: bool = False
     ) -> Optional[AccessToken]:
         if "home_account_id" not in account:
             return None
@@ -235,9 +315,10 @@ class SharedTokenCacheBase(ABC):  # pylint: disable=too-many-instance-attributes
                 target=list(scopes),
                 query={"home_account_id": account["home_account_id"]},
             )
+            now = int(time.time())
             for token in cache_entries:
                 expires_on = int(token["expires_on"])
-                if expires_on - 300 > int(time.time()):
+                if expires_on - 300 > now:
                     return AccessToken(token["secret"], expires_on)
         except Exception as ex:  # pylint:disable=broad-except
             message = "Error accessing cached data: {}".format(ex)
@@ -245,21 +326,22 @@ class SharedTokenCacheBase(ABC):  # pylint: disable=too-many-instance-attributes
 
         return None
 
-    def _get_refresh_tokens(self, account, is_cae: bool = False) -> List[str]:
+    def _get_refresh_token(self, account, is_cae: bool = False) -> Optional[str]:
         if "home_account_id" not in account:
-            return []
+            return None
 
         cache = self._cae_cache if is_cae else self._cache
         try:
             cache_entries = cache.find(
                 msal.TokenCache.CredentialType.REFRESH_TOKEN, query={"home_account_id": account["home_account_id"]}
             )
-            return [token["secret"] for token in cache_entries if "secret" in token]
+            return next((token["secret"] for token in cache_entries if "secret" in token), None)
         except Exception as ex:  # pylint:disable=broad-except
             message = "Error accessing cached data: {}".format(ex)
             raise CredentialUnavailableError(message=message) from ex
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)  # the platform can't change at runtime
     def supported() -> bool:
         """Whether the shared token cache is supported on the current platform.
 
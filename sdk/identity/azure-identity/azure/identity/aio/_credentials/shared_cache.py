@@ -2,7 +2,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 from azure.core.credentials import AccessToken
 from ..._internal.aad_client import AadClientBase
 from ... import CredentialUnavailableError
@@ -76,10 +76,24 @@ class SharedTokenCacheCredential(SharedTokenCacheBase, AsyncContextManager):
         if not scopes:
             raise ValueError("'get_token' requires at least one scope")
 
+        token = self._try_cached(scopes, is_cae=enable_cae)
+        if token:
+            return token
+
+        return await self._refresh(scopes, claims=claims, tenant_id=tenant_id, is_cae=enable_cae, **kwargs)
+
+    async def _refresh(
+        self,
+        scopes: Tuple[str, ...],
+        *,
+        claims: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        is_cae: bool = False,
+        **kwargs: Any
+    ) -> AccessToken:
         if not self._client_initialized:
             self._initialize_client()
 
-        is_cae = enable_cae
         token_cache = self._cae_cache if is_cae else self._cache
 
         # Try to load the cache if it is None.
@@ -90,18 +104,19 @@ class SharedTokenCacheCredential(SharedTokenCacheBase, AsyncContextManager):
             if not token_cache:
                 raise CredentialUnavailableError(message="Shared token cache unavailable")
 
-        account = self._get_account(self._username, self._tenant_id, is_cae=is_cae)
+            # the cache was just loaded, so it hasn't been searched for an access token yet
+            token = self._try_cached(scopes, is_cae=is_cae)
+            if token:
+                return token
 
-        token = self._get_cached_access_token(scopes, account, is_cae=is_cae)
-        if token:
-            return token
+        # the cache may have changed since the account was last resolved
+        account = self._refresh_account(is_cae=is_cae)
 
-        # try each refresh token, returning the first access token acquired
-        for refresh_token in self._get_refresh_tokens(account, is_cae=is_cae):
-            token = await self._client.obtain_token_by_refresh_token(
+        refresh_token = self._get_refresh_token(account, is_cae=is_cae)
+        if refresh_token is not None:
+            return await self._client.obtain_token_by_refresh_token(
                 scopes, refresh_token, claims=claims, tenant_id=tenant_id, **kwargs
             )
-            return token
 
         raise CredentialUnavailableError(message=NO_TOKEN.format(account.get("username")))
 
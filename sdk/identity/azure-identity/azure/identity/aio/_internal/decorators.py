@@ -17,11 +17,14 @@ _LOGGER = logging.getLogger(__name__)
 def log_get_token_async(fn):
     @functools.wraps(fn)
     async def wrapper(*args, **kwargs):
+        in_chain = within_credential_chain.get()
+        if not _LOGGER.isEnabledFor(logging.DEBUG if in_chain else logging.WARNING):
+            # neither outcome would be logged
+            return await fn(*args, **kwargs)
+
         try:
             token = await fn(*args, **kwargs)
-            _LOGGER.log(
-                logging.DEBUG if within_credential_chain.get() else logging.INFO, "%s succeeded", fn.__qualname__
-            )
+            _LOGGER.log(logging.DEBUG if in_chain else logging.INFO, "%s succeeded", fn.__qualname__)
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 try:
                     base64_meta_data = token.token.split(".")[1].encode("utf-8") + b"=="
@@ -39,7 +42,7 @@ def log_get_token_async(fn):
             return token
         except Exception as ex:  # pylint: disable=broad-except
             _LOGGER.log(
-                logging.DEBUG if within_credential_chain.get() else logging.WARNING,
+                logging.DEBUG if in_chain else logging.WARNING,
                 "%s failed: %s",
                 fn.__qualname__,
                 ex,
@@ -2,6 +2,12 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import weakref
+
+from azure.core.credentials import AccessToken
 from azure.core.exceptions import ClientAuthenticationError
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.identity import (
@@ -12,7 +18,9 @@ from azure.identity import (
     TokenCachePersistenceOptions,
 )
 from azure.identity._constants import DEVELOPER_SIGN_ON_CLIENT_ID, EnvironmentVariables
+from azure.identity._credentials.shared_cache import _SharedTokenCacheCredential
 from azure.identity._internal.shared_token_cache import (
+    CACHE_LOAD_RETRY_INTERVAL,
     KNOWN_ALIASES,
     MULTIPLE_ACCOUNTS,
     MULTIPLE_MATCHING_ACCOUNTS,
@@ -92,6 +100,16 @@ def test_supported():
     assert SharedTokenCacheCredential.supported()
 
 
+def test_instance_attributes():
+    """users should be able to weakly reference the credential and patch its methods"""
+
+    credential = SharedTokenCacheCredential(_cache=TokenCache())
+    assert weakref.ref(credential)() is credential
+    with patch.object(credential, "get_token") as get_token:
+        credential.get_token("scope")
+    assert get_token.call_count == 1
+
+
 def test_no_scopes():
     """The credential should raise when get_token is called with no scopes"""
 
@@ -604,6 +622,13 @@ def test_authentication_record_empty_cache():
         credential.get_token("scope")
 
 
+def test_authentication_record_none():
+    """an explicit authentication_record=None should be treated as no record"""
+
+    credential = SharedTokenCacheCredential(authentication_record=None, _cache=TokenCache())
+    assert isinstance(credential._credential, _SharedTokenCacheCredential)
+
+
 def test_authentication_record_no_match():
     tenant_id = "tenant-id"
     client_id = "client-id"
@@ -755,6 +780,167 @@ def test_writes_to_cache():
     assert len(cache.find(TokenCache.CredentialType.REFRESH_TOKEN)) == 1
 
 
+def test_account_resolved_once():
+    """the credential should search the cache for its account only once while the cache provides access tokens"""
+
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", access_token="***")
+    cache = populated_cache(account)
+
+    transport = Mock(send=Mock(side_effect=Exception("the credential should return a cached token")))
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    inner = credential._credential
+    with patch.object(inner, "_get_account", wraps=inner._get_account) as get_account:
+        credential.get_token("scope")
+        credential.get_token("scope")
+    assert get_account.call_count == 1
+
+
+def test_account_change_between_calls():
+    """the credential should notice when the accounts in the cache change between calls"""
+
+    first_account = get_account_event(uid="uid_a", utid="utid", username="a@x", refresh_token="refresh-token-a")
+    second_account = get_account_event(uid="uid_b", utid="utid", username="b@x", refresh_token="refresh-token-b")
+    cache = populated_cache(first_account)
+
+    transport = validating_transport(
+        requests=[
+            Request(required_data={"refresh_token": "refresh-token-a"}),
+            Request(required_data={"refresh_token": "refresh-token-b"}),
+        ],
+        responses=[mock_response(json_payload=build_aad_response(access_token="***")) for _ in range(2)],
+    )
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    credential.get_token("scope")
+
+    # replace the first account with the second
+    for refresh_token in cache.find(TokenCache.CredentialType.REFRESH_TOKEN):
+        cache.remove_rt(refresh_token)
+    for account in cache.find(TokenCache.CredentialType.ACCOUNT):
+        cache.remove_account(account)
+    TokenCache.add(cache, second_account)  # populated_cache disabled the instance's add method
+    credential.get_token("scope")
+
+    # with both accounts cached, the credential can't choose one
+    TokenCache.add(cache, first_account)
+    with pytest.raises(ClientAuthenticationError, match=MULTIPLE_ACCOUNTS):
+        credential.get_token("scope")
+
+
+def test_cached_access_token_skips_client_initialization():
+    """the credential shouldn't build its auth client when the cache holds a valid access token"""
+
+    expected_token = "***"
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", access_token=expected_token)
+    cache = populated_cache(account)
+
+    transport = Mock(send=Mock(side_effect=Exception("the credential should return a cached token")))
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    with patch.object(credential._credential, "_get_auth_client") as get_auth_client:
+        token = credential.get_token("scope")
+    assert token.token == expected_token
+    assert get_auth_client.call_count == 0
+
+
+def test_concurrent_client_initialization():
+    """concurrent client initialization should build only one auth client"""
+
+    credential = SharedTokenCacheCredential(_cache=TokenCache())
+    inner = credential._credential
+    callers = 4
+
+    # Without a lock, every caller reaches _get_auth_client and passes the barrier together. With one, the first
+    # caller waits alone until the barrier times out, and the others then find the client initialized.
+    barrier = threading.Barrier(callers, timeout=0.5)
+
+    def get_auth_client(**_):
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        return Mock()
+
+    with patch.object(inner, "_get_auth_client", side_effect=get_auth_client) as mock_get_auth_client:
+        with ThreadPoolExecutor(max_workers=callers) as executor:
+            list(executor.map(lambda _: inner._initialize_client(), range(callers)))
+    assert mock_get_auth_client.call_count == 1
+
+
+def test_concurrent_refresh_coalesced():
+    """concurrent get_token calls for the same token should redeem a refresh token only once"""
+
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", refresh_token="refresh-token")
+    cache = populated_cache(account)
+    credential = SharedTokenCacheCredential(_cache=cache)
+    inner = credential._credential
+    callers = 4
+    all_registered = threading.Event()
+
+    class InFlightRequests(dict):
+        """records each caller's lookup of the in-flight requests"""
+
+        lookups = 0
+
+        def get(self, *args):
+            InFlightRequests.lookups += 1
+            if InFlightRequests.lookups == callers:
+                all_registered.set()
+            return super().get(*args)
+
+    inner._inflight = InFlightRequests()
+
+    def obtain_token_by_refresh_token(*_, **__):
+        # keep the request in flight until every caller has found it
+        assert all_registered.wait(timeout=5)
+        return AccessToken("***", 42)
+
+    client = Mock(obtain_token_by_refresh_token=Mock(side_effect=obtain_token_by_refresh_token))
+    with patch.object(inner, "_get_auth_client", return_value=client):
+        with ThreadPoolExecutor(max_workers=callers) as executor:
+            tokens = list(executor.map(lambda _: credential.get_token("scope"), range(callers)))
+    assert all(token.token == "***" for token in tokens)
+    assert client.obtain_token_by_refresh_token.call_count == 1
+    assert not inner._inflight
+
+    # a call made after the first request completed should send a new request
+    credential.get_token("scope")
+    assert client.obtain_token_by_refresh_token.call_count == 2
+
+
+def test_transport_hint_logged_once(caplog):
+    """the credential should suggest sharing a transport only once per process, and only when it builds its own"""
+
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", refresh_token="refresh-token")
+    hint = "session_owner=False"
+
+    def count_hints():
+        return sum(hint in record.getMessage() for record in caplog.records)
+
+    with patch("azure.identity._credentials.shared_cache._transport_hint_logged", False):
+        with patch("azure.identity._credentials.shared_cache.AadClient"), caplog.at_level(logging.INFO):
+            credential = SharedTokenCacheCredential(_cache=populated_cache(account), transport=Mock())
+            credential.get_token("scope")
+            assert count_hints() == 0
+
+            for _ in range(2):
+                credential = SharedTokenCacheCredential(_cache=populated_cache(account))
+                credential.get_token("scope")
+            assert count_hints() == 1
+
+
+def test_cached_access_token_error():
+    """the credential should raise, not redeem a refresh token, when it can't read the cached access tokens"""
+
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", access_token="***")
+    cache = populated_cache(account)
+    for access_token in cache.find(TokenCache.CredentialType.ACCESS_TOKEN):
+        access_token["expires_on"] = "not a timestamp"
+
+    transport = Mock(send=Mock(side_effect=Exception("the credential shouldn't redeem a refresh token")))
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    with pytest.raises(CredentialUnavailableError, match="Error accessing cached data"):
+        credential.get_token("scope")
+
+
 def test_initialization():
     """the credential should attempt to load the cache when it's needed and no cache has been established."""
 
@@ -768,6 +954,13 @@ def test_initialization():
             credential.get_token("scope")
         assert mock_cache_loader.call_count == 1
 
+        # the credential shouldn't retry a failed load immediately
+        with pytest.raises(CredentialUnavailableError, match="Shared token cache unavailable"):
+            credential.get_token("scope")
+        assert mock_cache_loader.call_count == 1
+
+        # ...but should once the retry interval has passed
+        credential._credential._cache_load_failures[False] -= CACHE_LOAD_RETRY_INTERVAL
         with pytest.raises(CredentialUnavailableError, match="Shared token cache unavailable"):
             credential.get_token("scope")
         assert mock_cache_loader.call_count == 2
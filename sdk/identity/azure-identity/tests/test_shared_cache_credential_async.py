@@ -11,6 +11,7 @@ from azure.identity import CredentialUnavailableError, TokenCachePersistenceOpti
 from azure.identity.aio import SharedTokenCacheCredential
 from azure.identity._constants import EnvironmentVariables
 from azure.identity._internal.shared_token_cache import (
+    CACHE_LOAD_RETRY_INTERVAL,
     KNOWN_ALIASES,
     MULTIPLE_ACCOUNTS,
     MULTIPLE_MATCHING_ACCOUNTS,
@@ -614,6 +615,84 @@ async def test_authority_environment_variable():
     assert token.token == expected_access_token
 
 
+@pytest.mark.asyncio
+async def test_account_resolved_once():
+    """the credential should search the cache for its account only once while the cache provides access tokens"""
+
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", access_token="***")
+    cache = populated_cache(account)
+
+    transport = Mock(send=Mock(side_effect=Exception("the credential should return a cached token")))
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    with patch.object(credential, "_get_account", wraps=credential._get_account) as get_account:
+        await credential.get_token("scope")
+        await credential.get_token("scope")
+    assert get_account.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_account_change_between_calls():
+    """the credential should notice when the accounts in the cache change between calls"""
+
+    first_account = get_account_event(uid="uid_a", utid="utid", username="a@x", refresh_token="refresh-token-a")
+    second_account = get_account_event(uid="uid_b", utid="utid", username="b@x", refresh_token="refresh-token-b")
+    cache = populated_cache(first_account)
+
+    transport = async_validating_transport(
+        requests=[
+            Request(required_data={"refresh_token": "refresh-token-a"}),
+            Request(required_data={"refresh_token": "refresh-token-b"}),
+        ],
+        responses=[mock_response(json_payload=build_aad_response(access_token="***")) for _ in range(2)],
+    )
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    await credential.get_token("scope")
+
+    # replace the first account with the second
+    for refresh_token in cache.find(TokenCache.CredentialType.REFRESH_TOKEN):
+        cache.remove_rt(refresh_token)
+    for account in cache.find(TokenCache.CredentialType.ACCOUNT):
+        cache.remove_account(account)
+    TokenCache.add(cache, second_account)  # populated_cache disabled the instance's add method
+    await credential.get_token("scope")
+
+    # with both accounts cached, the credential can't choose one
+    TokenCache.add(cache, first_account)
+    with pytest.raises(ClientAuthenticationError, match=MULTIPLE_ACCOUNTS):
+        await credential.get_token("scope")
+
+
+@pytest.mark.asyncio
+async def test_cached_access_token_skips_client_initialization():
+    """the credential shouldn't build its auth client when the cache holds a valid access token"""
+
+    expected_token = "***"
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", access_token=expected_token)
+    cache = populated_cache(account)
+
+    transport = Mock(send=Mock(side_effect=Exception("the credential should return a cached token")))
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    with patch.object(credential, "_get_auth_client") as get_auth_client:
+        token = await credential.get_token("scope")
+    assert token.token == expected_token
+    assert get_auth_client.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_access_token_error():
+    """the credential should raise, not redeem a refresh token, when it can't read the cached access tokens"""
+
+    account = get_account_event(uid="uid_a", utid="utid", username="spam@eggs", access_token="***")
+    cache = populated_cache(account)
+    for access_token in cache.find(TokenCache.CredentialType.ACCESS_TOKEN):
+        access_token["expires_on"] = "not a timestamp"
+
+    transport = Mock(send=Mock(side_effect=Exception("the credential shouldn't redeem a refresh token")))
+    credential = SharedTokenCacheCredential(_cache=cache, transport=transport)
+    with pytest.raises(CredentialUnavailableError, match="Error accessing cached data"):
+        await credential.get_token("scope")
+
+
 @pytest.mark.asyncio
 async def test_initialization():
     """the credential should attempt to load the cache when it's needed and no cache has been established."""
@@ -628,6 +707,13 @@ async def test_initialization():
             await credential.get_token("scope")
         assert mock_cache_loader.call_count == 1
 
+        # the credential shouldn't retry a failed load immediately
+        with pytest.raises(CredentialUnavailableError, match="Shared token cache unavailable"):
+            await credential.get_token("scope")
+        assert mock_cache_loader.call_count == 1
+
+        # ...but should once the retry interval has passed
+        credential._cache_load_failures[False] -= CACHE_LOAD_RETRY_INTERVAL
         with pytest.raises(CredentialUnavailableError, match="Shared token cache unavailable"):
             await credential.get_token("scope")
         assert mock_cache_loader.call_count == 2